@@ -10,18 +10,52 @@ while adding centralized management capabilities.
 """
 
 import asyncio
-import json
 import logging
 import sys
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 import signal
 import os
+import stat
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 
-import structlog
-import typer
-from pydantic import BaseModel, ValidationError
+import msgspec
+
+if TYPE_CHECKING:
+    import structlog
+
+
+# Upper bound on a single stdin line; MCP requests can carry large tool arguments
+_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# Bytes requested per stdin read; one read can carry a whole burst of messages
+_STDIN_READ_SIZE = 64 * 1024
+
+# Largest chunk of queued responses the stdout writer joins into one write
+_MAX_WRITE_BATCH_BYTES = 1024 * 1024
+
+# While other requests are in flight, wait this long for their responses to
+# join the current write, unless it has already grown past the byte threshold
+_WRITE_LINGER_SECONDS = 0.001
+_WRITE_LINGER_BYTES = 64 * 1024
+
+# Accepted --log-level names, including the stdlib aliases
+_LEVEL_MAP = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Headers sent with every control plane request, besides Authorization
+_DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "MCP-Bridge/1.0"
+}
 
 
 @dataclass
@@ -31,60 +65,173 @@ class BridgeConfig:
     auth_token: Optional[str] = None
     timeout_seconds: int = 30
     retry_attempts: int = 3
+    worker_count: int = 8
+    queue_size: int = 1024
     log_level: str = "INFO"
     log_file: Optional[str] = None
+    auth_header: str = field(init=False, repr=False, default="")
     
     def __post_init__(self):
+        env = os.environ
         # Load from environment if not set
         if not self.auth_token:
-            self.auth_token = os.getenv("MCP_AUTH_TOKEN")
+            self.auth_token = env.get("MCP_AUTH_TOKEN")
         # Only override URL if explicitly set and different from default
-        if env_url := os.getenv("MCP_CONTROL_PLANE_URL"):
+        if env_url := env.get("MCP_CONTROL_PLANE_URL"):
             if env_url != "https://localhost:8443":  # Don't override if it's the old default
                 self.control_plane_url = env_url
+        self.auth_header = f"Bearer {self.auth_token}"
 
 
-class MCPMessage(BaseModel):
+class MCPMessage(msgspec.Struct):
     """MCP protocol message structure"""
     jsonrpc: str = "2.0"
     id: Optional[Union[str, int]] = None
     method: Optional[str] = None
-    params: Optional[Dict[str, Any]] = None
+    # Kept as undecoded JSON; the bridge only forwards it to the control plane
+    params: msgspec.Raw = msgspec.Raw()
     result: Optional[Any] = None
     error: Optional[Dict[str, Any]] = None
 
 
+class ControlPlaneRequest(msgspec.Struct):
+    """Request body sent to the control plane's POST endpoints"""
+    method: Optional[str]
+    params: msgspec.Raw
+    id: Optional[Union[str, int]]
+
+
+class ControlPlaneReply(msgspec.Struct):
+    """Control plane response body, with result/error kept as undecoded JSON"""
+    result: msgspec.Raw = msgspec.Raw()
+    error: msgspec.Raw = msgspec.Raw()
+
+
+# Decoding parses and validates in a single pass over the raw bytes
+_decode_message = msgspec.json.Decoder(MCPMessage).decode
+_decode_reply = msgspec.json.Decoder(ControlPlaneReply).decode
+_json_dumps = msgspec.json.Encoder().encode
+
+# Sent in place of missing or null params
+_EMPTY_PARAMS = msgspec.Raw(b"{}")
+_NULL_PARAMS = msgspec.Raw(b"null")
+
+# Fixed pieces of a JSON-RPC response envelope
+_RESPONSE_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESULT_KEY = b',"result":'
+_ERROR_KEY = b',"error":'
+
+
+def _response_payload(request_id: Optional[Union[str, int]],
+                      result: Any = None, error: Any = None) -> bytes:
+    """Encode a JSON-RPC response by splicing encoded parts into a fixed envelope"""
+    parts = [_RESPONSE_PREFIX, _json_dumps(request_id)]
+    if error is not None:
+        parts += (_ERROR_KEY, _json_dumps(error))
+    else:
+        parts += (_RESULT_KEY, _json_dumps(result))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def _error_payload(request_id: Optional[Union[str, int]], code: int, message: str) -> bytes:
+    """Encode a JSON-RPC error response without going through MCPMessage"""
+    return _response_payload(request_id, error={"code": code, "message": message})
+
+
+# Replies to lines that never yield a request id are fixed; encode them once
+_PARSE_ERROR = _error_payload(None, -32700, "Parse error")
+_INVALID_REQUEST = _error_payload(None, -32600, "Invalid Request")
+
+
+def _rebind_response_id(request_id: Optional[Union[str, int]], body: bytes) -> bytes:
+    """Re-emit a control plane response under the client's original request id"""
+    try:
+        reply = _decode_reply(body)
+    except msgspec.DecodeError:
+        return body
+    
+    # A present-but-null error means success; a null result is still a valid result
+    if reply.error and reply.error != _NULL_PARAMS:
+        return _response_payload(request_id, error=reply.error)
+    if reply.result:
+        return _response_payload(request_id, result=reply.result)
+    return body
+
+
+def _render_log(event_dict: Dict[str, Any], default: Any = None) -> str:
+    """json.dumps-compatible serializer for structlog's JSONRenderer"""
+    return msgspec.json.encode(event_dict, enc_hook=default).decode()
+
+
+class _FileReader:
+    """Reads stdin redirected from a file or device, which pipe transports reject"""
+    
+    def __init__(self, fd: int):
+        self._fd = fd
+    
+    async def read(self, n: int) -> bytes:
+        """Read up to n bytes without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, os.read, self._fd, n)
+
+
 class MCPBridgeClient:
     """
     MCP Bridge Client that translates stdio MCP messages to HTTPS requests
     to the control plane.
     """
     
+    # MCP method -> control plane endpoint
+    _GET_ROUTES: Dict[str, str] = {
+        "tools/list": "/mcp/tools",
+        "resources/list": "/mcp/resources",
+        "prompts/list": "/mcp/prompts",
+    }
+    _POST_ROUTES: Dict[str, str] = {
+        "initialize": "/mcp/initialize",
+        "tools/call": "/mcp/tools/call",
+    }
+    
     def __init__(self, config: BridgeConfig):
         self.config = config
         self.logger = self._setup_logging()
         self.running = False
         self.session = None
+        self._reader: Optional[Union[asyncio.StreamReader, _FileReader]] = None
+        # stdin's blocking flag before the pipe transport cleared it, restored on exit
+        self._stdin_blocking: Optional[bool] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._stdout_fd = sys.stdout.fileno()
+        
+        # Worker pool fed by the stdin reader; None is the shutdown sentinel
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._inflight = 0
+        
+        # Encoded responses waiting for the stdout writer; None stops it
+        self._out_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         
         # Message correlation
-        self.pending_requests: Dict[str, asyncio.Future] = {}
+        self.pending_requests: Dict[Union[str, int], asyncio.Future] = {}
         
         # Performance tracking
-        self.stats = {
-            "messages_processed": 0,
-            "errors": 0,
-            "start_time": datetime.now()
-        }
+        self.messages_processed = 0
+        self.error_count = 0
+        self.start_monotonic = time.monotonic()
     
-    def _setup_logging(self) -> structlog.stdlib.BoundLogger:
+    def _setup_logging(self) -> "structlog.stdlib.BoundLogger":
         """Configure structured logging"""
+        import structlog
+        
+        handlers: List[logging.Handler] = [logging.StreamHandler(sys.stderr)]
+        if log_file := self.config.log_file:
+            handlers.append(logging.FileHandler(log_file))
+        
         logging.basicConfig(
-            level=getattr(logging, self.config.log_level.upper()),
+            level=_LEVEL_MAP[self.config.log_level.upper()],
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.StreamHandler(sys.stderr),
-                *([] if not self.config.log_file else [logging.FileHandler(self.config.log_file)])
-            ]
+            handlers=handlers
         )
         
         structlog.configure(
@@ -96,7 +243,7 @@ class MCPBridgeClient:
                 structlog.processors.StackInfoRenderer(),
                 structlog.processors.format_exc_info,
                 structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
+                structlog.processors.JSONRenderer(serializer=_render_log)
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
@@ -104,6 +251,9 @@ class MCPBridgeClient:
             cache_logger_on_first_use=True,
         )
         
+        # Checked once so per-message debug calls can skip building their kwargs
+        self._debug_enabled = logging.getLogger("mcp.bridge").isEnabledFor(logging.DEBUG)
+        
         return structlog.get_logger("mcp.bridge")
     
     async def start(self):
@@ -111,91 +261,204 @@ class MCPBridgeClient:
         self.logger.info("Starting MCP Bridge Client", config=self.config.__dict__)
         
         try:
-            # Set up signal handlers for graceful shutdown
+            # Set up signal handlers for graceful shutdown on the event loop
+            loop = asyncio.get_running_loop()
             for sig in (signal.SIGTERM, signal.SIGINT):
-                signal.signal(sig, self._signal_handler)
+                try:
+                    loop.add_signal_handler(sig, self._shutdown, sig)
+                except NotImplementedError:
+                    # Windows event loops have no signal support; hand off to the loop ourselves
+                    signal.signal(
+                        sig,
+                        lambda signum, frame: loop.call_soon_threadsafe(
+                            self._shutdown, signal.Signals(signum)
+                        )
+                    )
             
             self.running = True
             
             # Initialize HTTP session for control plane communication
             await self._init_http_session()
             
-            # Start the main message loop
-            await self._message_loop()
+            # Attach stdin to the event loop
+            await self._init_stdin()
+            
+            # Start the stdout writer, the worker pool and the main message loop
+            self._out_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer())
+            self._start_workers()
+            self._read_task = asyncio.create_task(self._message_loop())
+            await self._read_task
             
         except Exception as e:
             self.logger.error("Bridge client failed to start", error=str(e), exc_info=True)
             raise
         finally:
+            await self._stop_workers()
+            await self._stop_writer()
             await self._cleanup()
     
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully"""
-        self.logger.info("Received shutdown signal", signal=signum)
+    def _shutdown(self, sig: signal.Signals):
+        """Handle shutdown signals by stopping the stdin loop immediately"""
+        self.logger.info("Received shutdown signal", signal=sig.name)
         self.running = False
+        
+        # Unblocks a pending readline or a put into a full queue
+        if self._read_task:
+            self._read_task.cancel()
     
     async def _init_http_session(self):
         """Initialize HTTP session for control plane communication"""
         import httpx
         
         try:
+            # HTTP/2 multiplexes concurrent worker requests over one connection;
+            # over plain http:// httpx keeps using HTTP/1.1 keep-alive
             self.session = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout_seconds),
-            headers={
-                "Authorization": f"Bearer {self.config.auth_token}",
-                "Content-Type": "application/json",
-                "User-Agent": "MCP-Bridge/1.0"
-            }
-        )
+                base_url=self.config.control_plane_url,
+                http2=True,
+                timeout=httpx.Timeout(self.config.timeout_seconds),
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=60.0,
+                ),
+                headers={**_DEFAULT_HEADERS, "Authorization": self.config.auth_header}
+            )
             self.logger.info("HTTP session initialized", url=self.config.control_plane_url)
         except Exception as e:
             self.logger.error("Failed to initialize HTTP session", error=str(e))
             raise
-
+    
+    async def _init_stdin(self):
+        """Attach stdin to the event loop so reads don't need an executor thread"""
+        fd = sys.stdin.fileno()
+        mode = os.fstat(fd).st_mode
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or os.isatty(fd)):
+            # e.g. `bridge_client.py < requests.jsonl` or `< /dev/null`
+            self._reader = _FileReader(fd)
+            return
+        
+        # The transport makes the open file non-blocking, which a terminal or socket
+        # shares with stdout and, for a tty, the user's shell. Hand it a duplicate so
+        # fd 0 stays open and the flag can be put back in _cleanup.
+        self._stdin_blocking = os.get_blocking(fd)
+        pipe = os.fdopen(os.dup(fd), 'rb', buffering=0)
+        
+        loop = asyncio.get_running_loop()
+        self._reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(self._reader)
+        await loop.connect_read_pipe(lambda: protocol, pipe)
+    
+    def _start_workers(self):
+        """Start the pool of workers that process queued messages"""
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.config.worker_count)
+        ]
+    
+    async def _stop_workers(self):
+        """Stop the worker pool, draining queued messages on a clean EOF"""
+        if not self._workers:
+            return
+        
+        if self.running:
+            for _ in self._workers:
+                await self._queue.put(None)
+        else:
+            # Shutdown was requested (signal or client gone): drop in-flight work
+            for worker in self._workers:
+                worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def _worker(self):
+        """Process messages from the queue until the shutdown sentinel arrives"""
+        while True:
+            line = await self._queue.get()
+            if line is None:
+                break
+            self._inflight += 1
+            try:
+                await self._process_message(line)
+            finally:
+                self._inflight -= 1
     
     async def _message_loop(self):
-        """Main message processing loop"""
+        """Read messages from stdin and hand them to the worker pool"""
         self.logger.info("Starting message loop")
         
+        # Bytes of a message whose terminating newline hasn't arrived yet
+        partial = bytearray()
+        # Set after an oversized message was dropped, until its newline arrives
+        skipping = False
+        
         try:
             while self.running:
-                # Read message from stdin
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
+                # Read whatever is available and split it into messages ourselves
+                data = await self._reader.read(_STDIN_READ_SIZE)
                 
-                if not line:
+                if not data:
+                    # The last message may not be newline-terminated
+                    line = bytes(partial).strip()
+                    if line and not skipping:
+                        await self._queue.put(line)
                     self.logger.info("EOF received, shutting down")
                     break
                 
-                line = line.strip()
-                if not line:
+                end = data.rfind(b"\n")
+                if end < 0:
+                    if not skipping:
+                        partial += data
+                        if len(partial) > _MAX_MESSAGE_BYTES:
+                            # Reject just this message and resync at its newline
+                            self.logger.error("Dropping oversized message",
+                                              limit=_MAX_MESSAGE_BYTES)
+                            self.error_count += 1
+                            await self._send_response(_INVALID_REQUEST)
+                            partial = bytearray()
+                            skipping = True
                     continue
                 
-                await self._process_message(line)
+                if partial:
+                    lines = (bytes(partial) + data[:end]).split(b"\n")
+                else:
+                    lines = data[:end].split(b"\n")
+                partial = bytearray(data[end + 1:])
+                if skipping:
+                    # The first line is the tail of the dropped message
+                    del lines[0]
+                    skipping = False
+                
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        await self._queue.put(line)
                 
         except asyncio.CancelledError:
             self.logger.info("Message loop cancelled")
         except Exception as e:
             self.logger.error("Error in message loop", error=str(e), exc_info=True)
-            self.stats["errors"] += 1
+            self.error_count += 1
     
-    async def _process_message(self, raw_message: str):
+    async def _process_message(self, raw_message: bytes):
         """Process a single MCP message"""
         try:
-            # Parse JSON-RPC message
-            message_data = json.loads(raw_message)
-            message = MCPMessage.model_validate(message_data)
+            # Parse and validate the JSON-RPC message
+            message = _decode_message(raw_message)
             
-            self.logger.debug("Processing message", method=message.method, id=message.id)
-            self.stats["messages_processed"] += 1
+            if self._debug_enabled:
+                self.logger.debug("Processing message", method=message.method, id=message.id)
+            self.messages_processed += 1
             
             # Handle different message types
             if message.method:
                 # Check if this is a notification (no id field)
                 if message.id is None:
                     # This is a notification - just log it, no response needed
-                    self.logger.debug("Received notification", method=message.method)
+                    if self._debug_enabled:
+                        self.logger.debug("Received notification", method=message.method)
                     if message.method == "notifications/initialized":
                         self.logger.info("Client initialized successfully")
                     return
@@ -206,19 +469,22 @@ class MCPBridgeClient:
                 # This is a response - handle correlation
                 await self._handle_response(message)
             else:
-                self.logger.warning("Unknown message type", message=message_data)
+                self.logger.warning("Unknown message type",
+                                    message=raw_message.decode(errors="replace"))
         
-        except json.JSONDecodeError as e:
-            self.logger.error("Invalid JSON received", error=str(e), raw_message=raw_message)
+        except msgspec.ValidationError as e:
+            self.logger.error("Invalid MCP message", error=str(e),
+                              raw_message=raw_message.decode(errors="replace"))
             if self.running:
-                await self._send_error_response(None, -32700, "Parse error")
-        except ValidationError as e:
-            self.logger.error("Invalid MCP message", error=str(e), raw_message=raw_message)
+                await self._send_response(_INVALID_REQUEST)
+        except msgspec.DecodeError as e:
+            self.logger.error("Invalid JSON received", error=str(e),
+                              raw_message=raw_message.decode(errors="replace"))
             if self.running:
-                await self._send_error_response(None, -32600, "Invalid Request")
+                await self._send_response(_PARSE_ERROR)
         except Exception as e:
             self.logger.error("Error processing message", error=str(e), exc_info=True)
-            self.stats["errors"] += 1
+            self.error_count += 1
     
     async def _handle_request(self, message: MCPMessage):
         """Handle MCP request by forwarding to control plane"""
@@ -227,7 +493,7 @@ class MCPBridgeClient:
             response = await self._forward_to_control_plane(message)
             
             # Send response back to client
-            await self._send_response(response)
+            await self._send_response(response, message.id)
             
         except Exception as e:
             self.logger.error("Error handling request", error=str(e), method=message.method)
@@ -239,136 +505,166 @@ class MCPBridgeClient:
     
     async def _handle_response(self, message: MCPMessage):
         """Handle MCP response (for future use with bidirectional communication)"""
-        if message.id and str(message.id) in self.pending_requests:
-            future = self.pending_requests.pop(str(message.id))
+        future = self.pending_requests.pop(message.id, None)
+        if future is not None:
             future.set_result(message)
         else:
             self.logger.warning("Received response for unknown request", id=message.id)
     
-    async def _forward_to_control_plane(self, message: MCPMessage) -> MCPMessage:
-        """Forward MCP message to control plane and return response"""
+    async def _forward_to_control_plane(self, message: MCPMessage) -> bytes:
+        """Forward MCP message to control plane and return the raw JSON response"""
         if not self.session:
             raise RuntimeError("HTTP session not initialized")
         
         try:
             # Route different methods to appropriate endpoints
-            if message.method == "initialize":
-                return await self._call_control_plane_initialize(message)
-            elif message.method == "tools/list":
-                return await self._call_control_plane_get(f"/mcp/tools?request_id={message.id}")
-            elif message.method == "tools/call":
-                return await self._call_control_plane_post("/mcp/tools/call", message)
-            elif message.method == "resources/list":
-                return await self._call_control_plane_get(f"/mcp/resources?request_id={message.id}")
-            elif message.method == "prompts/list":
-                return await self._call_control_plane_get(f"/mcp/prompts?request_id={message.id}")
+            method = message.method
+            if path := self._GET_ROUTES.get(method):
+                body = await self._call_control_plane_get(f"{path}?request_id={message.id}")
+                # The query string turns the id into a string; echo the client's id
+                return _rebind_response_id(message.id, body)
+            elif path := self._POST_ROUTES.get(method):
+                return await self._call_control_plane_post(path, message)
             else:
-                return MCPMessage(
-                    id=message.id,
-                    error={
-                        "code": -32601,
-                        "message": f"Method not found: {message.method}"
-                    }
+                return _error_payload(
+                    message.id, -32601, f"Method not found: {message.method}"
                 )
                 
         except Exception as e:
             self.logger.error("Error forwarding to control plane", error=str(e), method=message.method)
             # Return error response instead of raising
-            return MCPMessage(
-                id=message.id,
-                error={
-                    "code": -32603,
-                    "message": f"Control plane error: {str(e)}"
-                }
+            return _error_payload(
+                message.id, -32603, f"Control plane error: {str(e)}"
             )
     
-    async def _call_control_plane_initialize(self, message: MCPMessage) -> MCPMessage:
-        """Handle initialize request to control plane"""
+    async def _call_control_plane_post(self, endpoint: str, message: MCPMessage) -> bytes:
+        """Make POST request to control plane"""
         try:
-            request_data = {
-                "method": message.method,
-                "params": message.params or {},
-                "id": message.id
-            }
+            params = message.params
+            if not params or params == _NULL_PARAMS:
+                params = _EMPTY_PARAMS
             
-            response = await self.session.post(
-                f"{self.config.control_plane_url}/mcp/initialize",
-                json=request_data
+            # The client's params bytes are spliced into the body unparsed
+            request = ControlPlaneRequest(
+                method=message.method,
+                params=params,
+                id=message.id
             )
-            response.raise_for_status()
-            
-            result = response.json()
-            return MCPMessage.model_validate(result)
-            
-        except Exception as e:
-            self.logger.error("Initialize request failed", error=str(e))
-            raise
-    
-    async def _call_control_plane_post(self, endpoint: str, message: MCPMessage) -> MCPMessage:
-        """Make POST request to control plane"""
-        try:
-            request_data = {
-                "method": message.method,
-                "params": message.params or {},
-                "id": message.id
-            }
             
             response = await self.session.post(
-                f"{self.config.control_plane_url}{endpoint}",
-                json=request_data
+                endpoint,
+                content=_json_dumps(request)
             )
             response.raise_for_status()
             
-            result = response.json()
-            return MCPMessage.model_validate(result)
+            return response.content
             
         except Exception as e:
             self.logger.error("POST request failed", endpoint=endpoint, error=str(e))
             raise
     
-    async def _call_control_plane_get(self, endpoint: str) -> MCPMessage:
+    async def _call_control_plane_get(self, endpoint: str) -> bytes:
         """Make GET request to control plane"""
         try:
-            response = await self.session.get(
-                f"{self.config.control_plane_url}{endpoint}"
-            )
+            response = await self.session.get(endpoint)
             response.raise_for_status()
             
-            result = response.json()
-            return MCPMessage.model_validate(result)
+            return response.content
             
         except Exception as e:
             self.logger.error("GET request failed", endpoint=endpoint, error=str(e))
             raise
     
-    async def _send_response(self, message: MCPMessage):
-        """Send response message to stdout"""
+    async def _send_response(self, payload: bytes,
+                             request_id: Optional[Union[str, int]] = None):
+        """Queue an encoded response message for the stdout writer"""
+        self._out_queue.put_nowait(payload)
+        if self._debug_enabled:
+            self.logger.debug("Queued response", id=request_id)
+    
+    async def _wait_stdout_writable(self):
+        """Wait until the client has drained enough of stdout to accept more"""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        
+        def on_writable():
+            if not ready.done():
+                ready.set_result(None)
+        
+        loop.add_writer(self._stdout_fd, on_writable)
         try:
-            response_json = message.model_dump(exclude_none=True)
-            response_str = json.dumps(response_json)
+            await ready
+        finally:
+            loop.remove_writer(self._stdout_fd)
+    
+    async def _writer(self):
+        """Write queued responses to stdout, coalescing concurrent ones"""
+        while True:
+            payload = await self._out_queue.get()
+            if payload is None:
+                break
             
-            print(response_str, flush=True)
-            self.logger.debug("Sent response", id=message.id)
-        except BrokenPipeError:
-            # Client has closed the connection - stop gracefully
-            self.logger.info("Client disconnected (broken pipe)")
-            self.running = False
-        except Exception as e:
-            self.logger.error("Error sending response", error=str(e), id=message.id)
-            # Don't try to send another error response - could cause infinite loop
+            # Drain whatever else is ready into the same write, lingering briefly
+            # for responses from requests that are still being processed
+            batch = [payload]
+            size = len(payload)
+            stop = False
+            while size < _MAX_WRITE_BATCH_BYTES:
+                if not self._out_queue.empty():
+                    payload = self._out_queue.get_nowait()
+                elif self._inflight and size < _WRITE_LINGER_BYTES:
+                    try:
+                        payload = await asyncio.wait_for(
+                            self._out_queue.get(), _WRITE_LINGER_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    break
+                
+                if payload is None:
+                    stop = True
+                    break
+                batch.append(payload)
+                size += len(payload)
+            
+            try:
+                # Write straight to the fd, bypassing the TextIOWrapper and its flush.
+                # The empty tail makes join emit the final newline in the same copy.
+                batch.append(b"")
+                data = memoryview(b"\n".join(batch))
+                while data:
+                    try:
+                        data = data[os.write(self._stdout_fd, data):]
+                    except BlockingIOError:
+                        # stdout shares a non-blocking open file with stdin; finish
+                        # the batch once it drains, since a partial frame can't be undone
+                        await self._wait_stdout_writable()
+            except BrokenPipeError:
+                # Client has closed the connection - stop gracefully
+                self.logger.info("Client disconnected (broken pipe)")
+                self.running = False
+                break
+            except Exception as e:
+                self.logger.error("Error sending response", error=str(e))
+                # Don't try to send another error response - could cause infinite loop
+            
+            if stop:
+                break
+    
+    async def _stop_writer(self):
+        """Flush queued responses and stop the stdout writer"""
+        if not self._writer_task:
+            return
+        
+        self._out_queue.put_nowait(None)
+        await asyncio.gather(self._writer_task, return_exceptions=True)
+        self._writer_task = None
     
     async def _send_error_response(self, request_id: Optional[Union[str, int]], 
                                   code: int, message: str):
         """Send error response to stdout"""
-        try:
-            error_response = MCPMessage(
-                id=request_id,
-                error={"code": code, "message": message}
-            )
-            await self._send_response(error_response)
-        except Exception as e:
-            # If we can't send error response, just log and continue
-            self.logger.error("Failed to send error response", error=str(e), request_id=request_id)
+        await self._send_response(_error_payload(request_id, code, message), request_id)
     
     async def _cleanup(self):
         """Clean up resources"""
@@ -377,18 +673,25 @@ class MCPBridgeClient:
         if self.session:
             await self.session.aclose()
         
+        if self._stdin_blocking:
+            try:
+                os.set_blocking(sys.stdin.fileno(), True)
+            except (OSError, ValueError):
+                pass
+        
         # Log final statistics
-        uptime = datetime.now() - self.stats["start_time"]
         self.logger.info(
             "Bridge client shutdown complete",
-            uptime_seconds=uptime.total_seconds(),
-            messages_processed=self.stats["messages_processed"],
-            errors=self.stats["errors"]
+            uptime_seconds=time.monotonic() - self.start_monotonic,
+            messages_processed=self.messages_processed,
+            errors=self.error_count
         )
 
 
 def main():
     """Main entry point for the bridge client"""
+    import typer
+    
     app = typer.Typer()
     
     @app.command()
@@ -399,6 +702,11 @@ def main():
         log_file: Optional[str] = typer.Option(None, help="Log file path"),
     ):
         """Run the MCP Bridge Client"""
+        if log_level.upper() not in _LEVEL_MAP:
+            raise typer.BadParameter(
+                f"must be one of {', '.join(_LEVEL_MAP)}", param_hint="--log-level"
+            )
+        
         config = BridgeConfig(
             control_plane_url=control_plane_url,
             auth_token=auth_token,
@@ -408,6 +716,13 @@ def main():
         
         bridge = MCPBridgeClient(config)
         
+        # uvloop is an optional speedup; the default loop works everywhere
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+        
         try:
             asyncio.run(bridge.start())
         except KeyboardInterrupt:
@@ -5,12 +5,17 @@ Provides token-based authentication for bridge clients accessing the control pla
 """
 
 import hashlib
+import logging
 import secrets
 import time
-from typing import List, Optional
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Optional
 import structlog
 
 logger = structlog.get_logger("auth")
+_MONO = time.monotonic
+# Level checks go to the stdlib logger, which works however structlog is configured
+_level_logger = logging.getLogger("auth")
 
 
 class AuthService:
@@ -24,7 +29,13 @@ class AuthService:
             valid_tokens: List of valid bearer tokens
         """
         self.valid_tokens = set(valid_tokens)
-        self.token_usage = {}  # Track token usage for monitoring
+        # Track token usage for monitoring, keyed by token hash
+        self._usage_count: DefaultDict[str, int] = defaultdict(int)
+        self._last_used: Dict[str, float] = {}  # Monotonic clock
+        # Converts monotonic timestamps to wall-clock time for reporting
+        self._wall_offset = time.time() - _MONO()
+        # Usage-stats key for each valid token, derived once instead of per request
+        self._token_hashes = {token: self._hash_token(token) for token in self.valid_tokens}
         
         logger.info("Auth service initialized", token_count=len(valid_tokens))
     
@@ -38,28 +49,41 @@ class AuthService:
         Returns:
             True if token is valid, False otherwise
         """
-        if not token or token not in self.valid_tokens:
-            logger.warning("Invalid token attempted", token_prefix=token[:8] if token else "None")
+        token_hash = self._token_hashes.get(token) if token else None
+        if token_hash is None:
+            if _level_logger.isEnabledFor(logging.WARNING):
+                logger.warning("Invalid token attempted", token_prefix=token[:8] if token else "None")
             return False
         
         # Track token usage
-        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
-        self.token_usage[token_hash] = {
-            "last_used": time.time(),
-            "usage_count": self.token_usage.get(token_hash, {}).get("usage_count", 0) + 1
-        }
+        self._usage_count[token_hash] += 1
+        self._last_used[token_hash] = _MONO()
         
-        logger.debug("Token validated successfully", token_hash=token_hash)
+        if _level_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Token validated successfully", token_hash=token_hash)
         return True
     
     def get_token_stats(self) -> dict:
         """Get token usage statistics"""
+        wall_offset = self._wall_offset
+        usage_stats = {
+            token_hash: {
+                "last_used": last_used + wall_offset,
+                "usage_count": self._usage_count[token_hash]
+            }
+            for token_hash, last_used in self._last_used.items()
+        }
         return {
             "total_tokens": len(self.valid_tokens),
-            "active_tokens": len(self.token_usage),
-            "usage_stats": self.token_usage
+            "active_tokens": len(usage_stats),
+            "usage_stats": usage_stats
         }
     
+    @staticmethod
+    def _hash_token(token: str) -> str:
+        """Derive a stable, non-reversible key for a token's usage stats"""
+        return hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+    
     @staticmethod
     def generate_token() -> str:
         """Generate a new secure random token"""
@@ -68,12 +92,14 @@ class AuthService:
     def add_token(self, token: str) -> None:
         """Add a new valid token"""
         self.valid_tokens.add(token)
+        self._token_hashes[token] = self._hash_token(token)
         logger.info("Token added", token_count=len(self.valid_tokens))
     
     def remove_token(self, token: str) -> bool:
         """Remove a token"""
         if token in self.valid_tokens:
             self.valid_tokens.remove(token)
+            del self._token_hashes[token]
             logger.info("Token removed", token_count=len(self.valid_tokens))
             return True
         return False
\ No newline at end of file
@@ -4,23 +4,51 @@ Configuration management for MCP Control Plane
 Handles loading and validation of YAML configuration files for the control plane server.
 """
 
+import hashlib
+import json
 import os
+import stat
+import tempfile
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationError, validator
 import structlog
 
+# Use the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 logger = structlog.get_logger("config")
 
+# Accepted values for the enumerated config fields
+_SERVER_TYPES = frozenset({"python", "npx", "uv"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Default config locations, in lookup order
+_CONFIG_CANDIDATES = (
+    "config/control_plane.yaml",
+    "/etc/mcp/control_plane.yaml",
+    os.path.expanduser("~/.mcp/control_plane.yaml"),
+    "control_plane.yaml",
+)
+
+# Validated configs by absolute path, kept while the file's mtime and size match
+_LOAD_CACHE_SIZE = 32
+_LOAD_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], ControlPlaneConfig]]" = OrderedDict()
+
 
 class MCPServerConfig(BaseModel):
     """Configuration for a single MCP server"""
     id: str = Field(..., description="Unique identifier for the MCP server")
     name: Optional[str] = Field(None, description="Human-readable name")
     type: str = Field(..., description="Server type: python, npx, or uv")
-    command: List[str] = Field(..., description="Command to start the server")
-    args: List[str] = Field(default_factory=list, description="Additional arguments")
+    command: Tuple[str, ...] = Field(..., description="Command to start the server")
+    args: Tuple[str, ...] = Field(default_factory=tuple, description="Additional arguments")
     cwd: Optional[str] = Field(None, description="Working directory")
     env: Dict[str, str] = Field(default_factory=dict, description="Environment variables")
     timeout: int = Field(30, description="Startup timeout in seconds")
@@ -29,7 +57,7 @@ class MCPServerConfig(BaseModel):
     
     @validator('type')
     def validate_type(cls, v):
-        if v not in ['python', 'npx', 'uv']:
+        if v not in _SERVER_TYPES:
             raise ValueError('Server type must be one of: python, npx, uv')
         return v
     
@@ -56,9 +84,10 @@ class ServerConfig(BaseModel):
     
     @validator('log_level')
     def validate_log_level(cls, v):
-        if v.upper() not in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+        level = v.upper()
+        if level not in _LOG_LEVELS:
             raise ValueError('Invalid log level')
-        return v.upper()
+        return level
 
 
 class ControlPlaneConfig(BaseModel):
@@ -84,30 +113,50 @@ class ControlPlaneConfig(BaseModel):
         Returns:
             Loaded configuration
         """
+        # One stat per candidate; the result doubles as the cache key below
+        st: Optional[os.stat_result] = None
         if config_path is None:
             # Look for config in default locations
-            possible_paths = [
-                "config/control_plane.yaml",
-                "/etc/mcp/control_plane.yaml",
-                os.path.expanduser("~/.mcp/control_plane.yaml"),
-                "control_plane.yaml"
-            ]
-            
-            config_path = None
-            for path in possible_paths:
-                if Path(path).exists():
-                    config_path = path
-                    break
+            for path in _CONFIG_CANDIDATES:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                config_path = path
+                break
+        elif config_path:
+            try:
+                st = os.stat(config_path)
+            except OSError:
+                pass
         
-        if config_path and Path(config_path).exists():
+        if st is not None:
+            key = os.path.abspath(config_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            
+            cached = _LOAD_CACHE.get(key)
+            if cached is not None and cached[0] == stamp:
+                _LOAD_CACHE.move_to_end(key)
+                # Callers may mutate the result, so never hand out the cached model
+                return cached[1].model_copy(deep=True)
+            
             logger.info("Loading configuration from file", path=config_path)
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
-        else:
-            logger.info("No config file found, using environment variables")
-            config_data = cls._load_from_env()
+            config = _read_sidecar(key, stamp)
+            if config is None:
+                with open(config_path, 'r') as f:
+                    config_data = yaml.load(f, Loader=_YamlLoader)
+                
+                config = cls.model_validate(config_data)
+                _write_sidecar(key, st, config)
+            
+            _LOAD_CACHE[key] = (stamp, config)
+            _LOAD_CACHE.move_to_end(key)
+            if len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+                _LOAD_CACHE.popitem(last=False)
+            return config.model_copy(deep=True)
         
-        return cls.model_validate(config_data)
+        logger.info("No config file found, using environment variables")
+        return cls.model_validate(cls._load_from_env())
     
     @classmethod
     def _load_from_env(cls) -> Dict[str, Any]:
@@ -140,23 +189,98 @@ class ControlPlaneConfig(BaseModel):
     
     def save(self, config_path: str) -> None:
         """Save configuration to file"""
-        config_data = self.model_dump()
+        # JSON mode turns the tuple fields into lists, which the safe dumper can write
+        config_data = self.model_dump(mode="json")
         
         # Ensure directory exists
         Path(config_path).parent.mkdir(parents=True, exist_ok=True)
         
         with open(config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2,
+                      sort_keys=False)
         
         logger.info("Configuration saved", path=config_path)
     
+    # Built on first use; code that edits mcp_servers in place must drop them
+    # with self.__dict__.pop("_by_id", None) and likewise for _enabled_servers
+    @cached_property
+    def _by_id(self) -> Dict[str, MCPServerConfig]:
+        """MCP server configurations indexed by ID"""
+        # Reversed so the first server wins on duplicate IDs, as with a linear scan
+        return {server.id: server for server in reversed(self.mcp_servers)}
+    
+    @cached_property
+    def _enabled_servers(self) -> Tuple[MCPServerConfig, ...]:
+        """Enabled MCP server configurations, in config order"""
+        return tuple(server for server in self.mcp_servers if server.enabled)
+    
     def get_enabled_servers(self) -> List[MCPServerConfig]:
         """Get list of enabled MCP servers"""
-        return [server for server in self.mcp_servers if server.enabled]
+        return list(self._enabled_servers)
     
     def get_server_by_id(self, server_id: str) -> Optional[MCPServerConfig]:
         """Get MCP server configuration by ID"""
-        for server in self.mcp_servers:
-            if server.id == server_id:
-                return server
-        return None
\ No newline at end of file
+        return self._by_id.get(server_id)
+
+
+class _ConfigSidecar(BaseModel):
+    """Validated config saved as JSON next to the YAML file it was loaded from"""
+    source: Tuple[int, int] = Field(..., description="mtime_ns and size of the YAML file")
+    schema_hash: str = Field(..., description="_schema_fingerprint() of the writing process")
+    config: ControlPlaneConfig
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint() -> str:
+    """Identify the config models, so sidecars from other code versions are ignored"""
+    digest = hashlib.blake2b(digest_size=16)
+    # Covers field names, types and defaults
+    digest.update(json.dumps(ControlPlaneConfig.model_json_schema(), sort_keys=True).encode())
+    # Validators don't show up in the schema, so include this module's source too
+    try:
+        with open(__file__, 'rb') as f:
+            digest.update(f.read())
+    except OSError:
+        pass
+    return digest.hexdigest()
+
+
+def _sidecar_path(config_path: str) -> str:
+    return config_path + ".cache.json"
+
+
+def _read_sidecar(config_path: str, stamp: Tuple[int, int]) -> Optional[ControlPlaneConfig]:
+    """Return the sidecar's config if it was written from this exact YAML file"""
+    try:
+        with open(_sidecar_path(config_path), 'rb') as f:
+            sidecar = _ConfigSidecar.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return None
+    
+    if sidecar.source != stamp or sidecar.schema_hash != _schema_fingerprint():
+        return None
+    return sidecar.config
+
+
+def _write_sidecar(config_path: str, st: os.stat_result, config: ControlPlaneConfig) -> None:
+    """Save a JSON sidecar so the next process can skip parsing the YAML"""
+    sidecar = _ConfigSidecar(
+        source=(st.st_mtime_ns, st.st_size),
+        schema_hash=_schema_fingerprint(),
+        config=config
+    )
+    directory = os.path.dirname(config_path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(sidecar.model_dump_json().encode())
+            # Same permissions as the YAML file, since both hold the auth tokens
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+            os.replace(tmp_path, _sidecar_path(config_path))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        # Read-only config directories are fine; the YAML is simply parsed each time
+        logger.debug("Could not write config sidecar", path=config_path, error=str(e))
@@ -12,24 +12,37 @@ to appropriate MCP servers via stdio connections.
 import asyncio
 import json
 import logging
+import queue
 import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 from pathlib import Path
 
+import orjson
 import structlog
 import uvicorn
-from fastapi import FastAPI, HTTPException, Depends, Request, status
+from fastapi import FastAPI, HTTPException, Depends, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from config import ControlPlaneConfig
-from mcp_client_pool import MCPClientPool
+from mcp_client_pool import LIST_CACHE_TTL_SECONDS, MCPClientPool
 from auth import AuthService
 
 
+def _mask_client_token(logger, method_name, event_dict):
+    """Shorten client_token to a prefix, only for events that are emitted"""
+    token = event_dict.get("client_token")
+    if token is not None:
+        event_dict["client_token"] = token[:10] + "..."
+    return event_dict
+
+
 # Configure structured logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +53,7 @@ logging.basicConfig(
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
+        _mask_client_token,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -101,6 +115,92 @@ class MCPResponse(BaseModel):
     error: Optional[Dict[str, Any]] = None
 
 
+def _mcp_response(id: Optional[Any] = None,
+                  result: Optional[Dict[str, Any]] = None,
+                  error: Optional[Dict[str, Any]] = None) -> Response:
+    """Encode an MCPResponse-shaped body with orjson, omitting unset fields"""
+    body: Dict[str, Any] = {"jsonrpc": "2.0"}
+    if id is not None:
+        body["id"] = id
+    if result is not None:
+        body["result"] = result
+    if error is not None:
+        body["error"] = error
+    return Response(content=orjson.dumps(body), media_type="application/json")
+
+
+def _mcp_result_response(id: Optional[Any], result: bytes) -> Response:
+    """Splice an already-encoded result into an MCPResponse-shaped body"""
+    parts = [b'{"jsonrpc":"2.0"']
+    if id is not None:
+        parts += (b',"id":', orjson.dumps(id))
+    parts += (b',"result":', result, b"}")
+    return Response(content=b"".join(parts), media_type="application/json")
+
+
+# Encoded list results by result key, as
+# (pool version, monotonic expiry, item count, JSON bytes)
+_list_cache: Dict[str, Tuple[int, float, int, bytes]] = {}
+
+
+async def _cached_list(key: str,
+                       fetch: Callable[[], Awaitable[List[Dict[str, Any]]]]) -> Tuple[int, bytes]:
+    """Return the encoded {key: [...]} result, refetching when the pool has changed"""
+    # Snapshot before fetching so a change during the fetch invalidates the entry
+    version = mcp_pool.version
+    now = time.monotonic()
+    cached = _list_cache.get(key)
+    if cached is not None and cached[0] == version and now < cached[1]:
+        return cached[2], cached[3]
+    
+    # Expire with the oldest per-server list behind this result, so the two
+    # caches together never serve data older than the pool's TTL
+    items = await fetch()
+    result = orjson.dumps({key: items})
+    expiry = mcp_pool.list_expiry.get(key, now + LIST_CACHE_TTL_SECONDS)
+    _list_cache[key] = (version, expiry, len(items), result)
+    return len(items), result
+
+
+# Request bodies on the POST endpoints are validated straight from the raw JSON
+_initialize_adapter = TypeAdapter(MCPInitializeRequest)
+_tool_call_adapter = TypeAdapter(MCPToolCallRequest)
+
+
+async def _validate_body(raw_request: Request, adapter: TypeAdapter) -> Any:
+    """Parse and validate a request body in one pass, reporting errors as 422"""
+    try:
+        return adapter.validate_json(await raw_request.body())
+    except ValidationError as e:
+        # Locate errors under "body", as FastAPI's own body validation does
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
+
+# The 422 FastAPI documents by itself for routes that declare their body; the
+# HTTPValidationError schema is emitted for the list routes' query parameters
+_VALIDATION_ERROR_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    422: {
+        "description": "Validation Error",
+        "content": {
+            "application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}
+        },
+    }
+}
+
+
+def _body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Describe a raw-Request body in the OpenAPI schema as a declared body would be"""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
@@ -109,17 +209,65 @@ class HealthResponse(BaseModel):
     mcp_servers: Dict[str, str]
 
 
+# Our own capabilities, returned for every initialize request
+INITIALIZE_RESULT: Dict[str, Any] = {
+    "protocolVersion": "2025-06-18",
+    "capabilities": {
+        "tools": {},
+        "resources": {},
+        "prompts": {}
+    },
+    "serverInfo": {
+        "name": "MCP Control Plane",
+        "version": "1.0.0"
+    }
+}
+
+
+def _start_log_listener() -> QueueListener:
+    """Move the root log handlers onto a background thread fed by a queue"""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush queued records and give the root logger its handlers back"""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    
+    listener.stop()
+    for handler in listener.handlers:
+        root.addHandler(handler)
+
+
 # Global instances
 config: Optional[ControlPlaneConfig] = None
 mcp_pool: Optional[MCPClientPool] = None
 auth_service: Optional[AuthService] = None
 
+# Resolved at startup, once the log level is final; gates per-request INFO lines
+_info_enabled = True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global config, mcp_pool, auth_service
+    global config, mcp_pool, auth_service, _info_enabled
     
+    # Request handlers only enqueue log records; stderr I/O happens off the loop
+    log_listener = _start_log_listener()
+    _info_enabled = logger.isEnabledFor(logging.INFO)
     logger.info("Starting MCP Control Plane server")
     
     try:
@@ -145,6 +293,7 @@ async def lifespan(app: FastAPI):
         if mcp_pool:
             await mcp_pool.stop()
         logger.info("Control plane server shutdown complete")
+        _stop_log_listener(log_listener)
 
 
 # Create FastAPI application
@@ -167,6 +316,18 @@ app.add_middleware(
 # Security
 security = HTTPBearer(auto_error=False)
 
+# The challenge header never varies, so the dict is shared across rejections
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    """Build a 401 for one rejection; a re-raised shared instance keeps growing its traceback"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers=_BEARER_CHALLENGE,
+    )
+
 
 async def get_current_user(
     request: Request,
@@ -175,110 +336,110 @@ async def get_current_user(
     """Authenticate the request using Bearer token"""
     if not credentials or not credentials.credentials:
         logger.warning("Missing authentication token", client_ip=request.client.host)
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing authentication token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Missing authentication token")
     
     if not auth_service or not auth_service.validate_token(credentials.credentials):
         logger.warning("Invalid authentication token", client_ip=request.client.host)
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Invalid authentication token")
     
     return credentials.credentials
 
 
 # API Endpoints
 
+# Health bodies are reused for this long while the pool version is unchanged
+_HEALTH_TTL_SECONDS = 0.25
+# (expiry on the monotonic clock, pool version, encoded HealthResponse)
+_health_cache: Tuple[float, int, bytes] = (0.0, -1, b"")
+
+
 @app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint"""
-    mcp_status = {}
-    if mcp_pool:
-        mcp_status = await mcp_pool.get_status()
+    global _health_cache
     
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(),
-        version="1.0.0",
-        mcp_servers=mcp_status
-    )
+    now = time.monotonic()
+    version = mcp_pool.version if mcp_pool else -1
+    expires, cached_version, body = _health_cache
+    if now >= expires or version != cached_version:
+        mcp_status = {}
+        if mcp_pool:
+            mcp_status = await mcp_pool.get_status()
+        
+        body = orjson.dumps({
+            "status": "healthy",
+            "timestamp": datetime.now(),
+            "version": "1.0.0",
+            "mcp_servers": mcp_status
+        })
+        _health_cache = (now + _HEALTH_TTL_SECONDS, version, body)
+    
+    return Response(content=body, media_type="application/json")
 
 
-@app.post("/mcp/initialize", response_model=MCPResponse)
+@app.post("/mcp/initialize", response_model=MCPResponse,
+          responses=_VALIDATION_ERROR_RESPONSES,
+          openapi_extra=_body_openapi(MCPInitializeRequest))
 async def mcp_initialize(
-    request: MCPInitializeRequest,
+    raw_request: Request,
     token: str = Depends(get_current_user)
-) -> MCPResponse:
+) -> Response:
     """Handle MCP initialize request"""
-    logger.info("MCP initialize request", client_token=token[:10] + "...")
+    request: MCPInitializeRequest = await _validate_body(raw_request, _initialize_adapter)
+    if _info_enabled:
+        logger.info("MCP initialize request", client_token=token)
     
     # For initialize, we return our own capabilities
-    return MCPResponse(
-        id=request.id,
-        result={
-            "protocolVersion": "2025-06-18",
-            "capabilities": {
-                "tools": {},
-                "resources": {},
-                "prompts": {}
-            },
-            "serverInfo": {
-                "name": "MCP Control Plane",
-                "version": "1.0.0"
-            }
-        }
-    )
+    return _mcp_response(id=request.id, result=INITIALIZE_RESULT)
 
 @app.get("/mcp/tools", response_model=MCPResponse)
 async def mcp_tools_list(
     request_id: Optional[str] = None,
     token: str = Depends(get_current_user)
-) -> MCPResponse:
+) -> Response:
     """List all available tools from MCP servers"""
-    logger.info("Tools list request", client_token=token[:10] + "...")
+    if _info_enabled:
+        logger.info("Tools list request", client_token=token)
     
     if not mcp_pool:
         raise HTTPException(status_code=500, detail="MCP pool not initialized")
     
     try:
         # Aggregate tools from all MCP servers
-        all_tools = await mcp_pool.get_all_tools()
+        tool_count, result = await _cached_list("tools", mcp_pool.get_all_tools)
         
-        logger.info("Tools listed successfully", tool_count=len(all_tools))
-        return MCPResponse(
-            id=request_id,
-            result={"tools": all_tools}
-        )
+        if _info_enabled:
+            logger.info("Tools listed successfully", tool_count=tool_count)
+        return _mcp_result_response(request_id, result)
         
     except Exception as e:
         logger.error("Error listing tools", error=str(e))
-        return MCPResponse(
+        return _mcp_response(
             id=request_id,
             error={"code": -32603, "message": f"Internal error: {str(e)}"}
         )
 
 
-@app.post("/mcp/tools/call", response_model=MCPResponse)
+@app.post("/mcp/tools/call", response_model=MCPResponse,
+          responses=_VALIDATION_ERROR_RESPONSES,
+          openapi_extra=_body_openapi(MCPToolCallRequest))
 async def mcp_tool_call(
-    request: MCPToolCallRequest,
+    raw_request: Request,
     token: str = Depends(get_current_user)
-) -> MCPResponse:
+) -> Response:
     """Execute a tool call via appropriate MCP server"""
+    request: MCPToolCallRequest = await _validate_body(raw_request, _tool_call_adapter)
     tool_name = request.params.get("name")
     arguments = request.params.get("arguments", {})
     
-    logger.info("Tool call request", tool=tool_name, client_token=token[:10] + "...")
+    if _info_enabled:
+        logger.info("Tool call request", tool=tool_name, client_token=token)
     
     if not mcp_pool:
         raise HTTPException(status_code=500, detail="MCP pool not initialized")
     
     if not tool_name:
-        return MCPResponse(
+        return _mcp_response(
             id=request.id,
             error={"code": -32602, "message": "Missing tool name"}
         )
@@ -287,13 +448,13 @@ async def mcp_tool_call(
         # Execute tool via MCP pool
         result = await mcp_pool.call_tool(tool_name, arguments)
         
-        return MCPResponse(
+        return _mcp_response(
             id=request.id,
             result=result
         )
     except Exception as e:
         logger.error("Error executing tool", tool=tool_name, error=str(e))
-        return MCPResponse(
+        return _mcp_response(
             id=request.id,
             error={"code": -32603, "message": f"Tool execution failed: {str(e)}"}
         )
@@ -303,24 +464,22 @@ async def mcp_tool_call(
 async def mcp_resources_list(
     request_id: Optional[str] = None,
     token: str = Depends(get_current_user)
-) -> MCPResponse:
+) -> Response:
     """List all available resources from MCP servers"""
-    logger.info("Resources list request", client_token=token[:10] + "...")
+    if _info_enabled:
+        logger.info("Resources list request", client_token=token)
     
     if not mcp_pool:
         raise HTTPException(status_code=500, detail="MCP pool not initialized")
     
     try:
         # Aggregate resources from all MCP servers
-        all_resources = await mcp_pool.get_all_resources()
+        _, result = await _cached_list("resources", mcp_pool.get_all_resources)
         
-        return MCPResponse(
-            id=request_id,
-            result={"resources": all_resources}
-        )
+        return _mcp_result_response(request_id, result)
     except Exception as e:
         logger.error("Error listing resources", error=str(e))
-        return MCPResponse(
+        return _mcp_response(
             id=request_id,
             error={"code": -32603, "message": f"Internal error: {str(e)}"}
         )
@@ -330,24 +489,22 @@ async def mcp_resources_list(
 async def mcp_prompts_list(
     request_id: Optional[str] = None,
     token: str = Depends(get_current_user)
-) -> MCPResponse:
+) -> Response:
     """List all available prompts from MCP servers"""
-    logger.info("Prompts list request", client_token=token[:10] + "...")
+    if _info_enabled:
+        logger.info("Prompts list request", client_token=token)
     
     if not mcp_pool:
         raise HTTPException(status_code=500, detail="MCP pool not initialized")
     
     try:
         # Aggregate prompts from all MCP servers
-        all_prompts = await mcp_pool.get_all_prompts()
+        _, result = await _cached_list("prompts", mcp_pool.get_all_prompts)
         
-        return MCPResponse(
-            id=request_id,
-            result={"prompts": all_prompts}
-        )
+        return _mcp_result_response(request_id, result)
     except Exception as e:
         logger.error("Error listing prompts", error=str(e))
-        return MCPResponse(
+        return _mcp_response(
             id=request_id,
             error={"code": -32603, "message": f"Internal error: {str(e)}"}
         )
@@ -362,6 +519,7 @@ def main():
     parser.add_argument("--port", type=int, default=8444, help="Port to bind to")
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--log-level", default="INFO", help="Log level")
+    parser.add_argument("--access-log", action="store_true", help="Log every HTTP request")
     
     args = parser.parse_args()
     
@@ -370,13 +528,14 @@ def main():
     
     logger.info("Starting MCP Control Plane server", host=args.host, port=args.port)
     
-    # Run the server
+    # Run the server. With uvicorn[standard], loop and http stay on "auto",
+    # which picks uvloop and httptools where they are installed.
     uvicorn.run(
         "control_plane_server:app",
         host=args.host,
         port=args.port,
         log_level=args.log_level.lower(),
-        access_log=True,
+        access_log=args.access_log,
         reload=False
     )
 
@@ -6,18 +6,59 @@ and request routing.
 """
 
 import asyncio
-import json
+import logging
 import os
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+import orjson
 import structlog
 
 from config import MCPServerConfig
 
 logger = structlog.get_logger("mcp_pool")
 
+# Lets the output readers skip decoding stray server output nobody will log
+# (same stdlib level-check approach as auth._level_logger)
+_level_logger = logging.getLogger("mcp_pool")
+
+# Bytes requested per stdout read; one read can carry many responses
+_STDOUT_READ_SIZE = 64 * 1024
+
+# Bytes requested per stderr read; stderr is only drained, never parsed
+_STDERR_READ_SIZE = 64 * 1024
+
+# Upper bound on a single response line from an MCP server
+_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# Requests one server may have awaiting a response before senders must wait
+_MAX_INFLIGHT_REQUESTS = 1024
+
+# Seconds a request may wait for its response
+_REQUEST_TIMEOUT_SECONDS = 30.0
+
+# Stray non-JSON and stderr output is truncated to this many bytes when logged
+_LOG_OUTPUT_BYTES = 200
+
+# Constant head of each method's request frames, up to the params value
+_REQUEST_PREFIXES: Dict[str, bytes] = {}
+
+
+def _encode_request(request_id: int, method: str, params: Dict[str, Any]) -> bytes:
+    """Encode a newline-terminated JSON-RPC request frame"""
+    prefix = _REQUEST_PREFIXES.get(method)
+    if prefix is None:
+        prefix = b'{"jsonrpc":"2.0","method":' + orjson.dumps(method) + b',"params":'
+        _REQUEST_PREFIXES[method] = prefix
+    # Splice the encoded params and id onto the fixed head
+    return b"".join((prefix, orjson.dumps(params), b',"id":%d}\n' % request_id))
+
+
+# How long a server's tools/resources/prompts list is reused before re-asking
+LIST_CACHE_TTL_SECONDS = 60.0
+
 
 class ServerStatus(Enum):
     """MCP Server status"""
@@ -27,6 +68,10 @@ class ServerStatus(Enum):
     STOPPED = "stopped"
 
 
+# Status strings looked up directly, skipping the enum .value descriptor
+_STATUS_STR = {status: status.value for status in ServerStatus}
+
+
 @dataclass
 class MCPServerInstance:
     """Represents a running MCP server instance"""
@@ -37,10 +82,31 @@ class MCPServerInstance:
     failure_count: int = 0
     last_error: Optional[str] = None
     request_count: int = 0
+    # Full environment for the server process, merged once from the pool's base
+    env: Dict[str, str] = field(default_factory=dict)
     
     # Communication
     request_id_counter: int = field(default=0)
-    pending_requests: Dict[str, asyncio.Future] = field(default_factory=dict)
+    pending_requests: Dict[int, asyncio.Future] = field(default_factory=dict)
+    # Encoded requests waiting for the stdin writer, with the future awaiting each
+    outbox: "Optional[asyncio.Queue[Tuple[bytes, asyncio.Future]]]" = None
+    writer_task: Optional[asyncio.Task] = None
+    inflight: Optional[asyncio.Semaphore] = None
+    
+    # Last list results by method, as (monotonic fetch time, items)
+    list_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = field(default_factory=dict)
+
+
+def _make_lister(method: str,
+                 result_key: str) -> Callable[["MCPClientPool"], Awaitable[List[Dict[str, Any]]]]:
+    """Build a pool method that lists one kind of item from all servers"""
+    async def lister(self: "MCPClientPool") -> List[Dict[str, Any]]:
+        return await self._list_all(method, result_key)
+    
+    lister.__name__ = f"get_all_{result_key}"
+    lister.__qualname__ = f"MCPClientPool.{lister.__name__}"
+    lister.__doc__ = f"Get all available {result_key} from all servers"
+    return lister
 
 
 class MCPClientPool:
@@ -57,6 +123,18 @@ class MCPClientPool:
         self.servers: Dict[str, MCPServerInstance] = {}
         self.tool_registry: Dict[str, str] = {}  # tool_name -> server_id
         self.running = False
+        # Snapshot of our environment that every server's env is layered on
+        self._base_env = dict(os.environ)
+        # Bumped whenever a server changes state; callers key list caches on it
+        self.version = 0
+        # Result key -> monotonic time the last merged list stops being fresh,
+        # i.e. when its oldest per-server part expires
+        self.list_expiry: Dict[str, float] = {}
+        # (deadline, server_id, request_id) in send order; the timeout is fixed,
+        # so deadlines only increase and one sweeper expires them in order
+        self._deadlines: Deque[Tuple[float, str, int]] = deque()
+        self._deadline_added: Optional[asyncio.Event] = None
+        self._sweeper_task: Optional[asyncio.Task] = None
         
         logger.info("MCP client pool initialized", server_count=len(server_configs))
     
@@ -64,11 +142,17 @@ class MCPClientPool:
         """Start all MCP servers"""
         logger.info("Starting MCP client pool")
         self.running = True
+        # Created here so they bind to the running loop
+        self._deadline_added = asyncio.Event()
+        self._sweeper_task = asyncio.create_task(self._expire_requests())
         
         # Initialize server instances
         for config in self.server_configs:
             if config.enabled:
-                self.servers[config.id] = MCPServerInstance(config=config)
+                self.servers[config.id] = MCPServerInstance(
+                    config=config,
+                    env={**self._base_env, **config.env}
+                )
         
         # Start all servers
         start_tasks = [
@@ -99,6 +183,10 @@ class MCPClientPool:
         if stop_tasks:
             await asyncio.gather(*stop_tasks, return_exceptions=True)
         
+        if self._sweeper_task:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
+        
         logger.info("MCP client pool stopped")
     
     async def _start_server(self, server_id: str) -> None:
@@ -110,30 +198,37 @@ class MCPClientPool:
         
         try:
             server.status = ServerStatus.STARTING
+            # A new process may offer different tools
+            server.list_cache.clear()
             
             # Build command
             cmd = config.command + config.args
             
-            # Prepare environment
-            env = dict(os.environ)
-            env.update(config.env)
-            
             # Start process
             server.process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=env,
+                env=server.env,
                 cwd=config.cwd
             )
             
             server.start_time = time.time()
             server.status = ServerStatus.RUNNING
+            self.version += 1
             
             # Start background tasks for this server
-            asyncio.create_task(self._monitor_server(server_id))
+            if server.writer_task:
+                server.writer_task.cancel()
+            server.outbox = asyncio.Queue()
+            server.inflight = asyncio.Semaphore(_MAX_INFLIGHT_REQUESTS)
+            server.writer_task = asyncio.create_task(
+                self._write_requests(server_id, server.process, server.outbox)
+            )
+            asyncio.create_task(self._monitor_server(server_id, server.process))
             asyncio.create_task(self._handle_server_output(server_id))
+            asyncio.create_task(self._drain_stderr(server_id, server.process))
             
             logger.info("MCP server started successfully", server_id=server_id)
             
@@ -142,6 +237,7 @@ class MCPClientPool:
             server.status = ServerStatus.FAILED
             server.last_error = str(e)
             server.failure_count += 1
+            self.version += 1
     
     async def _stop_server(self, server_id: str) -> None:
         """Stop a single MCP server"""
@@ -160,29 +256,71 @@ class MCPClientPool:
             
             server.status = ServerStatus.STOPPED
             server.process = None
+            self.version += 1
+            self._fail_pending(server, f"server {server_id} stopped")
+        
+        if server.writer_task:
+            server.writer_task.cancel()
+            server.writer_task = None
     
-    async def _monitor_server(self, server_id: str) -> None:
-        """Monitor server health and restart if needed"""
+    def _fail_pending(self, server: MCPServerInstance, reason: str) -> None:
+        """Fail every request still awaiting a response from a server"""
+        for future in server.pending_requests.values():
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
+        server.pending_requests.clear()
+    
+    async def _monitor_server(self, server_id: str, process: asyncio.subprocess.Process) -> None:
+        """Wait for a server process to exit and restart it if needed"""
         server = self.servers[server_id]
         
-        while self.running and server.config.enabled:
-            if server.process and server.process.returncode is not None:
-                # Process has died
-                logger.warning("MCP server process died", server_id=server_id, 
-                             returncode=server.process.returncode)
-                
-                server.status = ServerStatus.FAILED
-                server.failure_count += 1
-                
-                if server.config.restart_on_failure and server.failure_count < 5:
-                    logger.info("Restarting failed MCP server", server_id=server_id)
-                    await asyncio.sleep(min(2 ** server.failure_count, 30))  # Exponential backoff
-                    await self._start_server(server_id)
-                else:
-                    logger.error("MCP server failed permanently", server_id=server_id)
-                    break
+        returncode = await process.wait()
+        if not self.running or server.process is not process:
+            # Stopped on purpose, or already replaced by a newer process
+            return
+        
+        logger.warning("MCP server process died", server_id=server_id, 
+                     returncode=returncode)
+        
+        server.status = ServerStatus.FAILED
+        server.failure_count += 1
+        self.version += 1
+        # Nothing will answer these now, so don't leave callers waiting out the timeout
+        self._fail_pending(server, f"server {server_id} died (returncode={returncode})")
+        
+        # A failed restart starts no new monitor, so keep retrying from here
+        while server.config.restart_on_failure and server.failure_count < 5:
+            logger.info("Restarting failed MCP server", server_id=server_id)
+            await asyncio.sleep(min(2 ** server.failure_count, 30))  # Exponential backoff
+            if not self.running or server.status != ServerStatus.FAILED:
+                # Stopped, or restarted by someone else meanwhile
+                return
+            await self._start_server(server_id)
+            if server.status == ServerStatus.RUNNING:
+                # The new process gets its own monitor
+                return
+        
+        logger.error("MCP server failed permanently", server_id=server_id)
+    
+    async def _write_requests(self, server_id: str, process: asyncio.subprocess.Process,
+                              outbox: "asyncio.Queue[Tuple[bytes, asyncio.Future]]") -> None:
+        """Write queued requests to a server's stdin, one drain per batch"""
+        stdin = process.stdin
+        
+        while True:
+            # Take everything queued so far so concurrent requests share one drain
+            batch = [await outbox.get()]
+            while not outbox.empty():
+                batch.append(outbox.get_nowait())
             
-            await asyncio.sleep(10)  # Check every 10 seconds
+            try:
+                stdin.writelines([frame for frame, _ in batch])
+                await stdin.drain()
+            except Exception as e:
+                logger.error("Error writing to server", server_id=server_id, error=str(e))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
     
     async def _handle_server_output(self, server_id: str) -> None:
         """Handle output from MCP server"""
@@ -191,35 +329,90 @@ class MCPClientPool:
         if not server.process or not server.process.stdout:
             return
         
+        stdout = server.process.stdout
+        # Bytes of a message whose terminating newline hasn't arrived yet
+        partial = bytearray()
+        # Set after an oversized message was dropped, until its newline arrives
+        skipping = False
+        
         try:
             while self.running and server.process.returncode is None:
-                line = await server.process.stdout.readline()
-                if not line:
+                # Read whatever is available and split it into messages ourselves
+                data = await stdout.read(_STDOUT_READ_SIZE)
+                if not data:
                     break
                 
-                try:
-                    # Parse JSON-RPC response
-                    response = json.loads(line.decode().strip())
-                    await self._handle_server_response(server_id, response)
-                except json.JSONDecodeError:
-                    # Not a JSON response, might be log output
-                    logger.debug("Non-JSON output from server", 
-                               server_id=server_id, output=line.decode().strip())
-                except Exception as e:
-                    logger.error("Error handling server output", 
-                               server_id=server_id, error=str(e))
+                end = data.rfind(b"\n")
+                if end < 0:
+                    if not skipping:
+                        partial += data
+                        if len(partial) > _MAX_MESSAGE_BYTES:
+                            logger.error("Dropping oversized output from server",
+                                         server_id=server_id, limit=_MAX_MESSAGE_BYTES)
+                            partial = bytearray()
+                            skipping = True
+                    continue
+                
+                if partial:
+                    lines = (bytes(partial) + data[:end]).split(b"\n")
+                else:
+                    lines = data[:end].split(b"\n")
+                partial = bytearray(data[end + 1:])
+                if skipping:
+                    # The first line is the tail of the dropped message
+                    del lines[0]
+                    skipping = False
+                
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        await self._handle_server_line(server_id, line)
         
         except Exception as e:
             logger.error("Error reading server output", server_id=server_id, error=str(e))
     
+    async def _drain_stderr(self, server_id: str, process: asyncio.subprocess.Process) -> None:
+        """Keep reading server stderr so a chatty server never blocks on a full pipe"""
+        stderr = process.stderr
+        if not stderr:
+            return
+        
+        try:
+            while True:
+                data = await stderr.read(_STDERR_READ_SIZE)
+                if not data:
+                    return
+                if _level_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Stderr output from server",
+                                 server_id=server_id, output=data[:_LOG_OUTPUT_BYTES].decode(errors="replace"))
+        except Exception as e:
+            logger.error("Error reading server stderr", server_id=server_id, error=str(e))
+    
+    async def _handle_server_line(self, server_id: str, line: bytes) -> None:
+        """Parse one line of server stdout and dispatch it"""
+        try:
+            # Parse JSON-RPC response
+            response = orjson.loads(line)
+            await self._handle_server_response(server_id, response)
+        except orjson.JSONDecodeError:
+            # Not a JSON response, might be log output
+            if _level_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Non-JSON output from server", 
+                           server_id=server_id, output=line[:_LOG_OUTPUT_BYTES].decode(errors="replace"))
+        except Exception as e:
+            logger.error("Error handling server output", 
+                       server_id=server_id, error=str(e))
+    
     async def _handle_server_response(self, server_id: str, response: Dict[str, Any]) -> None:
         """Handle a JSON-RPC response from MCP server"""
         server = self.servers[server_id]
         
+        # Our request ids are ints, so anything else can't be one of our responses
         response_id = response.get("id")
-        if response_id and str(response_id) in server.pending_requests:
+        future = (server.pending_requests.pop(response_id, None)
+                  if type(response_id) is int else None)
+        if future is not None:
             # This is a response to our request
-            future = server.pending_requests.pop(str(response_id))
             future.set_result(response)
         else:
             # This might be a notification or unsolicited response
@@ -228,49 +421,74 @@ class MCPClientPool:
     
     async def _send_request(self, server_id: str, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send a JSON-RPC request to an MCP server"""
+        if not self.running:
+            raise RuntimeError("MCP client pool is not running")
         server = self.servers.get(server_id)
         if not server or server.status != ServerStatus.RUNNING or not server.process:
             raise RuntimeError(f"MCP server {server_id} is not running")
         
-        # Generate request ID
-        server.request_id_counter += 1
-        request_id = str(server.request_id_counter)
-        
-        # Build request
-        request = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-            "params": params or {}
-        }
-        
-        # Create future for response
-        future = asyncio.Future()
-        server.pending_requests[request_id] = future
-        
-        try:
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            server.process.stdin.write(request_json.encode())
-            await server.process.stdin.drain()
+        # Wait for a free slot while the server already has too many in flight
+        async with server.inflight:
+            # Generate request ID
+            server.request_id_counter += 1
+            request_id = server.request_id_counter
+            
+            # Create future for response
+            future = asyncio.get_running_loop().create_future()
+            server.pending_requests[request_id] = future
             
-            server.request_count += 1
+            try:
+                # Queue the request for this server's stdin writer
+                frame = _encode_request(request_id, method, params or {})
+                server.outbox.put_nowait((frame, future))
+                
+                server.request_count += 1
+                
+                # Wait for the response; the sweeper fails the future on timeout
+                if not self._deadlines:
+                    self._deadline_added.set()
+                self._deadlines.append(
+                    (time.monotonic() + _REQUEST_TIMEOUT_SECONDS, server_id, request_id)
+                )
+                return await future
+                
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"Request to {server_id} timed out")
+            except Exception as e:
+                raise RuntimeError(f"Error sending request to {server_id}: {str(e)}")
+            finally:
+                # Also covers callers cancelled while waiting
+                server.pending_requests.pop(request_id, None)
+    
+    async def _expire_requests(self) -> None:
+        """Time out requests whose deadline has passed, oldest first"""
+        deadlines = self._deadlines
+        while True:
+            if not deadlines:
+                self._deadline_added.clear()
+                await self._deadline_added.wait()
+                continue
             
-            # Wait for response with timeout
-            response = await asyncio.wait_for(future, timeout=30.0)
-            return response
+            delay = deadlines[0][0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
             
-        except asyncio.TimeoutError:
-            server.pending_requests.pop(request_id, None)
-            raise RuntimeError(f"Request to {server_id} timed out")
-        except Exception as e:
-            server.pending_requests.pop(request_id, None)
-            raise RuntimeError(f"Error sending request to {server_id}: {str(e)}")
+            # Expire everything that is due in one pass
+            now = time.monotonic()
+            while deadlines and deadlines[0][0] <= now:
+                _, server_id, request_id = deadlines.popleft()
+                server = self.servers.get(server_id)
+                # Answered requests have already left pending_requests
+                future = server.pending_requests.get(request_id) if server else None
+                if future is not None and not future.done():
+                    future.set_exception(asyncio.TimeoutError())
     
     async def _discover_tools(self) -> None:
         """Discover tools from all running servers"""
         logger.info("Discovering tools from MCP servers")
-        self.tool_registry.clear()
+        # Built aside and swapped in whole, so call_tool never sees a partial registry
+        tool_registry: Dict[str, str] = {}
         
         for server_id, server in self.servers.items():
             if server.status == ServerStatus.RUNNING:
@@ -281,71 +499,72 @@ class MCPClientPool:
                     
                     if "result" in response and "tools" in response["result"]:
                         tools = response["result"]["tools"]
-                        logger.info("Found tools in response", server_id=server_id, tool_count=len(tools))
-                        for tool in tools:
-                            tool_name = tool.get("name")
-                            if tool_name:
-                                self.tool_registry[tool_name] = server_id
-                                logger.info("Registered tool", tool=tool_name, server=server_id)
+                        server.list_cache["tools/list"] = (time.monotonic(), tools)
+                        registered = {
+                            tool["name"]: server_id for tool in tools if tool.get("name")
+                        }
+                        tool_registry.update(registered)
+                        logger.info("Registered tools", server_id=server_id,
+                                    tool_count=len(registered), tools=list(registered)[:20])
                     else:
                         logger.warning("No tools found in response", server_id=server_id, response=response)
                 
                 except Exception as e:
                     logger.error("Error discovering tools", server_id=server_id, error=str(e), exc_info=True)
         
+        self.tool_registry = tool_registry
         logger.info("Tool discovery complete", tool_count=len(self.tool_registry))
     
-    async def get_all_tools(self) -> List[Dict[str, Any]]:
-        """Get all available tools from all servers"""
-        all_tools = []
-        logger.info("Getting all tools from MCP servers")
-        
-        for server_id, server in self.servers.items():
-            if server.status == ServerStatus.RUNNING:
-                try:
-                    response = await self._send_request(server_id, "tools/list", {})
-                    
-                    if "result" in response and "tools" in response["result"]:
-                        all_tools.extend(response["result"]["tools"])
-                
-                except Exception as e:
-                    logger.error("Error getting tools", server_id=server_id, error=str(e))
-        
-        return all_tools
+    async def _list_server(self, server_id: str, method: str,
+                           result_key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get one server's list, reusing the last result while it is fresh"""
+        server = self.servers[server_id]
+        cached = server.list_cache.get(method)
+        if cached is not None and time.monotonic() - cached[0] < LIST_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        response = await self._send_request(server_id, method)
+        if "result" in response and result_key in response["result"]:
+            items = response["result"][result_key]
+            server.list_cache[method] = (time.monotonic(), items)
+            return items
+        # Error replies aren't cached, so the next call asks again
+        return None
     
-    async def get_all_resources(self) -> List[Dict[str, Any]]:
-        """Get all available resources from all servers"""
-        all_resources = []
+    async def _list_all(self, method: str, result_key: str) -> List[Dict[str, Any]]:
+        """Send a list request to every running server concurrently and merge the results"""
+        server_ids = [
+            server_id for server_id, server in self.servers.items()
+            if server.status == ServerStatus.RUNNING
+        ]
+        responses = await asyncio.gather(
+            *(self._list_server(server_id, method, result_key) for server_id in server_ids),
+            return_exceptions=True
+        )
+        
+        items: List[Dict[str, Any]] = []
+        for server_id, response in zip(server_ids, responses):
+            if isinstance(response, BaseException):
+                logger.error(f"Error getting {result_key}", server_id=server_id, error=str(response))
+                # Don't let a cached partial list outlive this failure
+                self.version += 1
+                continue
+            
+            if response:
+                items.extend(response)
         
-        for server_id, server in self.servers.items():
-            if server.status == ServerStatus.RUNNING:
-                try:
-                    response = await self._send_request(server_id, "resources/list")
-                    
-                    if "result" in response and "resources" in response["result"]:
-                        all_resources.extend(response["result"]["resources"])
-                
-                except Exception as e:
-                    logger.error("Error getting resources", server_id=server_id, error=str(e))
+        fetched = [
+            self.servers[server_id].list_cache[method][0]
+            for server_id in server_ids
+            if method in self.servers[server_id].list_cache
+        ]
+        self.list_expiry[result_key] = min(fetched, default=time.monotonic()) + LIST_CACHE_TTL_SECONDS
         
-        return all_resources
+        return items
     
-    async def get_all_prompts(self) -> List[Dict[str, Any]]:
-        """Get all available prompts from all servers"""
-        all_prompts = []
-        
-        for server_id, server in self.servers.items():
-            if server.status == ServerStatus.RUNNING:
-                try:
-                    response = await self._send_request(server_id, "prompts/list")
-                    
-                    if "result" in response and "prompts" in response["result"]:
-                        all_prompts.extend(response["result"]["prompts"])
-                
-                except Exception as e:
-                    logger.error("Error getting prompts", server_id=server_id, error=str(e))
-        
-        return all_prompts
+    get_all_tools = _make_lister("tools/list", "tools")
+    get_all_resources = _make_lister("resources/list", "resources")
+    get_all_prompts = _make_lister("prompts/list", "prompts")
     
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool call via the appropriate server"""
@@ -368,6 +587,6 @@ class MCPClientPool:
     async def get_status(self) -> Dict[str, str]:
         """Get status of all MCP servers"""
         return {
-            server_id: server.status.value
+            server_id: _STATUS_STR[server.status]
             for server_id, server in self.servers.items()
         }
\ No newline at end of file